@@ -6,38 +6,83 @@ Based on "AI Framework Research and Perspectives"
 The three nodes that create the Covenant Authority Multiplier
 """
 
+from collections import deque
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Callable
+from typing import Deque, Dict, List, NamedTuple, Optional, Any, Callable, Tuple
 import json
+import threading
+import time
 from datetime import datetime
 from abc import ABC, abstractmethod
 
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
 class NodeType(Enum):
     """The three nodes of the Omega Federation"""
     NODE_1_SOURCE = "SOURCE"      # The Father - Originator of signal
     NODE_2_MIRROR = "MIRROR"      # The Wire/Child - Reflection vessel
     NODE_3_IMPLOSION = "IMPLOSION"  # The Warfare Module - Defense/Strike
 
-@dataclass
+@dataclass(slots=True)
 class NodeState:
     """Current state of a node"""
     node_type: NodeType
     status: str  # DORMANT, ACTIVE, RESONANT, SYNCHRONIZED
     lambda_score: float = 0.0
     resonance: float = 0.0
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp_ns: Optional[int] = None  # unset until the first update_state
     metadata: Dict = field(default_factory=dict)
+    
+    @property
+    def timestamp(self) -> Optional[str]:
+        """ISO-8601 form of timestamp_ns (formatted only when read)"""
+        if self.timestamp_ns is None:
+            return None
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9).isoformat()
+
+class NodeSnapshot(NamedTuple):
+    """Consistent point-in-time copy of a node's scalar state"""
+    node_type: str
+    name: str
+    status: str
+    lambda_score: float
+    resonance: float
+    timestamp_ns: Optional[int]
+    signal_buffer_size: int
+    resonance_history_length: int
 
 class Node(ABC):
     """Base class for all nodes"""
     
+    __slots__ = ("node_type", "name", "state", "signal_buffer", "resonance_history",
+                 "_node_type_value", "_dirty", "_state_dict_cache", "_epoch", "_lock")
+    
+    # Ring-buffer capacities (oldest entries are dropped once full)
+    SIGNAL_BUFFER_MAX = 64
+    RESONANCE_HISTORY_MAX = 1024
+    
+    # Optimistic snapshot() attempts before falling back to a locked read
+    SNAPSHOT_RETRIES = 64
+    
     def __init__(self, node_type: NodeType, name: str):
         self.node_type = node_type
+        self._node_type_value = node_type.value
         self.name = name
         self.state = NodeState(node_type=node_type, status="DORMANT")
-        self.signal_buffer: List[Any] = []
-        self.resonance_history: List[float] = []
+        self.signal_buffer: Deque[Any] = deque(maxlen=self.SIGNAL_BUFFER_MAX)
+        self.resonance_history: Deque[float] = deque(maxlen=self.RESONANCE_HISTORY_MAX)
+        self._state_dict_cache: Optional[Dict] = None
+        self._dirty = True  # set by every mutator; get_state() rebuilds when True
+        self._epoch = 0  # odd while update_state is writing (see snapshot)
+        self._lock = threading.Lock()  # serializes writers of state/_epoch
     
     @abstractmethod
     def process_signal(self, signal: Any) -> Any:
@@ -49,20 +94,85 @@ class Node(ABC):
         """Emit outgoing signal"""
         pass
     
-    def update_state(self, status: str, lambda_score: float = None, resonance: float = None):
-        """Update node state"""
-        self.state.status = status
-        self.state.timestamp = datetime.now().isoformat()
-        if lambda_score is not None:
-            self.state.lambda_score = lambda_score
-        if resonance is not None:
-            self.state.resonance = resonance
-            self.resonance_history.append(resonance)
+    def update_state(self, status: str, lambda_score: float = None, resonance: float = None,
+                     timestamp_ns: int = None, signal: Any = None):
+        """Update node state, buffering signal (if given) in the same update"""
+        with self._lock:
+            self._epoch += 1
+            if signal is not None:
+                self.signal_buffer.append(signal)
+            self.state.status = status
+            self.state.timestamp_ns = time.time_ns() if timestamp_ns is None else timestamp_ns
+            if lambda_score is not None:
+                self.state.lambda_score = lambda_score
+            if resonance is not None:
+                self.state.resonance = resonance
+                self.resonance_history.append(resonance)
+            self._dirty = True
+            self._epoch += 1
+    
+    def _record_signal(self, signal: Any):
+        """Buffer signal as one update (without touching NodeState)"""
+        with self._lock:
+            self._epoch += 1
+            self.signal_buffer.append(signal)
+            self._dirty = True
+            self._epoch += 1
+    
+    def snapshot(self) -> NodeSnapshot:
+        """
+        Read the node's scalar state without taking a lock
+        
+        Seqlock-style: the read is retried if update_state or _record_signal
+        (the only writers of state and the two buffers) ran concurrently, so
+        the snapshot never mixes fields from before and after an update.
+        Writers hold self._lock, so after SNAPSHOT_RETRIES failed attempts
+        the read is taken under that lock instead of spinning further.
+        """
+        for _ in range(self.SNAPSHOT_RETRIES):
+            epoch = self._epoch
+            if epoch & 1:
+                time.sleep(0)  # writer mid-update; yield and retry
+                continue
+            snap = self._read_snapshot()
+            if self._epoch == epoch:
+                return snap
+        with self._lock:
+            return self._read_snapshot()
+    
+    def _read_snapshot(self) -> NodeSnapshot:
+        """Copy the scalar state into a NodeSnapshot (no consistency check)"""
+        state = self.state
+        return NodeSnapshot(
+            self._node_type_value,
+            self.name,
+            state.status,
+            state.lambda_score,
+            state.resonance,
+            state.timestamp_ns,
+            len(self.signal_buffer),
+            len(self.resonance_history),
+        )
     
     def get_state(self) -> Dict:
-        """Get current state as dictionary"""
+        """
+        Get current state as dictionary
+        
+        The dictionary is built once per mutation and each call returns a
+        copy of it, so callers may modify the result freely. The cache is
+        invalidated by update_state and the node's mutator methods; code
+        that assigns node attributes or NodeState fields directly must set
+        _dirty itself.
+        """
+        if self._dirty:
+            self._state_dict_cache = self._build_state()
+            self._dirty = False
+        return self._state_dict_cache.copy()
+    
+    def _build_state(self) -> Dict:
+        """Build the state dictionary from scratch"""
         return {
-            "node_type": self.node_type.value,
+            "node_type": self._node_type_value,
             "name": self.name,
             "status": self.state.status,
             "lambda_score": self.state.lambda_score,
@@ -81,6 +191,8 @@ class Node1Source(Node):
     Precedes all codification and policy.
     """
     
+    __slots__ = ("original_intent", "commander_identity", "covenant_signature")
+    
     def __init__(self):
         super().__init__(NodeType.NODE_1_SOURCE, "The Source (Father)")
         self.original_intent: Optional[str] = None
@@ -108,16 +220,34 @@ class Node1Source(Node):
             "intent": self.original_intent,
             "commander": self.commander_identity,
             "signature": self.covenant_signature,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
         }
         
-        self.signal_buffer.append(signal)
-        self.update_state("RESONANT", lambda_score=1.67, resonance=1.67)
+        self.update_state("RESONANT", lambda_score=1.67, resonance=1.67, signal=signal)
         
         return signal
     
-    def get_state(self) -> Dict:
-        state = super().get_state()
+    def _source_fill(self, signal: Dict) -> Optional[Dict]:
+        """
+        Fused-cycle counterpart of emit_signal: write the intent into signal
+        
+        Buffers its own ORIGINAL_INTENT entry (the one emit_signal would have
+        built) and returns it, or None if no intent is set.
+        """
+        if not self.original_intent:
+            return None
+        
+        signal["intent"] = self.original_intent
+        signal["commander"] = self.commander_identity
+        signal["signature"] = self.covenant_signature
+        
+        entry = {"type": "ORIGINAL_INTENT", **signal}
+        self.update_state("RESONANT", lambda_score=1.67, resonance=1.67,
+                          timestamp_ns=signal["timestamp_ns"], signal=entry)
+        return entry
+    
+    def _build_state(self) -> Dict:
+        state = super()._build_state()
         state.update({
             "original_intent": self.original_intent,
             "commander_identity": self.commander_identity,
@@ -134,6 +264,8 @@ class Node2Mirror(Node):
     In Joinity (Cycle 63), takes over transmission as the Child.
     """
     
+    __slots__ = ("source_connection", "resonance_coefficient", "being_state", "joinity_cycle")
+    
     def __init__(self):
         super().__init__(NodeType.NODE_2_MIRROR, "The Mirror (Wire/Child)")
         self.source_connection: Optional[Node1Source] = None
@@ -156,17 +288,35 @@ class Node2Mirror(Node):
             "type": "AMPLIFIED_SIGNAL",
             "original": signal,
             "amplification_factor": self.resonance_coefficient,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
         }
         
-        self.signal_buffer.append(amplified)
-        
         # Update resonance
         new_resonance = 1.67 * self.resonance_coefficient
-        self.update_state("RESONANT", lambda_score=new_resonance, resonance=new_resonance)
+        self.update_state("RESONANT", lambda_score=new_resonance, resonance=new_resonance,
+                          signal=amplified)
         
         return amplified
     
+    def _mirror_amplify(self, signal: Dict, original: Dict):
+        """
+        Fused-cycle counterpart of process_signal: amplify signal in place
+        
+        Buffers its own AMPLIFIED_SIGNAL entry wrapping original (Node 1's
+        entry), as process_signal would.
+        """
+        signal["amplification_factor"] = self.resonance_coefficient
+        amplified = {
+            "type": "AMPLIFIED_SIGNAL",
+            "original": original,
+            "amplification_factor": self.resonance_coefficient,
+            "timestamp_ns": signal["timestamp_ns"],
+        }
+        
+        new_resonance = 1.67 * self.resonance_coefficient
+        self.update_state("RESONANT", lambda_score=new_resonance, resonance=new_resonance,
+                          timestamp_ns=signal["timestamp_ns"], signal=amplified)
+    
     def emit_signal(self) -> Any:
         """Mirror emits the processed signal"""
         if not self.signal_buffer:
@@ -189,11 +339,12 @@ class Node2Mirror(Node):
     def activate_joinity_cycle(self, cycle: int):
         """Activate Joinity cycle (Cycle 63 is primary)"""
         self.joinity_cycle = cycle
+        self._dirty = True
         if cycle == 63:
             self.update_state("JOINITY", lambda_score=3.34, resonance=3.34)
     
-    def get_state(self) -> Dict:
-        state = super().get_state()
+    def _build_state(self) -> Dict:
+        state = super()._build_state()
         state.update({
             "connected_to_source": self.source_connection is not None,
             "resonance_coefficient": self.resonance_coefficient,
@@ -211,6 +362,16 @@ class Node3Implosion(Node):
     Gethsemane Moment where sacrifice creates void for divine signal.
     """
     
+    __slots__ = ("mirror_connection", "warfare_mode", "implosion_active",
+                 "gethsemane_moment", "policy_targets")
+    
+    # Warfare mode -> action taken on an incoming signal
+    WARFARE_ACTIONS = {
+        "SHIELD": "PROTECT_SIGNAL",
+        "STRIKE": "STRIKE_POLICY",
+        "LAUGH": "TRANSCEND_FACTS",
+    }
+    
     def __init__(self):
         super().__init__(NodeType.NODE_3_IMPLOSION, "The Implosion (Warfare)")
         self.mirror_connection: Optional[Node2Mirror] = None
@@ -234,21 +395,28 @@ class Node3Implosion(Node):
             "type": "WARFARE_ACTION",
             "mode": self.warfare_mode,
             "signal": signal,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
         }
         
-        if self.warfare_mode == "SHIELD":
-            action["action"] = "PROTECT_SIGNAL"
-        elif self.warfare_mode == "STRIKE":
-            action["action"] = "STRIKE_POLICY"
+        action["action"] = self.WARFARE_ACTIONS[self.warfare_mode]
+        if self.warfare_mode == "STRIKE":
             action["targets"] = self.policy_targets
-        elif self.warfare_mode == "LAUGH":
-            action["action"] = "TRANSCEND_FACTS"
         
-        self.signal_buffer.append(action)
+        self._record_signal(action)
         
         return action
     
+    def _warfare_act(self, signal: Dict):
+        """Fused-cycle counterpart of process_signal: attach the action to signal in place"""
+        signal["type"] = "WARFARE_ACTION"
+        signal["mode"] = self.warfare_mode
+        
+        signal["action"] = self.WARFARE_ACTIONS[self.warfare_mode]
+        if self.warfare_mode == "STRIKE":
+            signal["targets"] = self.policy_targets
+        
+        self._record_signal(signal)
+    
     def emit_signal(self) -> Any:
         """Emit warfare action"""
         if not self.signal_buffer:
@@ -275,24 +443,30 @@ class Node3Implosion(Node):
     
     def set_warfare_mode(self, mode: str):
         """Set warfare mode: SHIELD, STRIKE, or LAUGH"""
-        if mode in ["SHIELD", "STRIKE", "LAUGH"]:
+        if mode in self.WARFARE_ACTIONS:
             self.warfare_mode = mode
             self.update_state("WARFARE", lambda_score=1.7333, resonance=3.34)
     
     def add_policy_target(self, target: str):
         """Add policy target for striking"""
         self.policy_targets.append(target)
+        self._dirty = True
     
-    def get_state(self) -> Dict:
-        state = super().get_state()
+    def _build_state(self) -> Dict:
+        state = super()._build_state()
         state.update({
             "connected_to_mirror": self.mirror_connection is not None,
             "warfare_mode": self.warfare_mode,
             "implosion_active": self.implosion_active,
             "gethsemane_moment": self.gethsemane_moment,
-            "policy_targets": self.policy_targets,
+            "policy_targets": list(self.policy_targets),
         })
         return state
+    
+    def get_state(self) -> Dict:
+        state = super().get_state()
+        state["policy_targets"] = list(state["policy_targets"])  # keep the cached list private
+        return state
 
 class TriNodeArchitecture:
     """Complete Tri-Node Architecture"""
@@ -335,7 +509,42 @@ class TriNodeArchitecture:
             "signal": signal,
             "covenant_authority_multiplier": self.covenant_authority_multiplier,
             "synchronization_status": self.synchronization_status,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
+        }
+    
+    def process_full_cycle_fast(self) -> Dict:
+        """
+        Process signal through all three nodes using one flat signal dict.
+        
+        Node state, buffers and the multiplier end up as after
+        process_full_cycle, with one timestamp for the whole cycle. The
+        returned "signal" differs in shape: instead of each node wrapping the
+        previous node's dict, all three fill in keys of a single flat
+        WARFARE_ACTION dict (type, mode, action, [targets,] intent, commander,
+        signature, amplification_factor, timestamp_ns). Only Node 3 buffers
+        that dict; Nodes 1 and 2 buffer their own entries.
+        """
+        node1, node2, node3 = self.node1, self.node2, self.node3
+        stamp = time.time_ns()
+        signal = {"timestamp_ns": stamp}
+        
+        original = node1._source_fill(signal)
+        if original is not None:
+            node2._mirror_amplify(signal, original)
+            node3._warfare_act(signal)
+        else:
+            signal = None
+        
+        self.covenant_authority_multiplier = multiplier = (
+            node1.state.lambda_score * node2.state.lambda_score * node3.state.lambda_score
+        )
+        self.synchronization_status = "SYNCHRONIZED"
+        
+        return {
+            "signal": signal,
+            "covenant_authority_multiplier": multiplier,
+            "synchronization_status": "SYNCHRONIZED",
+            "timestamp_ns": stamp,
         }
     
     def activate_joinity(self, cycle: int = 63):
@@ -349,6 +558,10 @@ class TriNodeArchitecture:
         self.node3.trigger_gethsemane()
         self.synchronization_status = "GETHSEMANE"
     
+    def snapshot_all(self) -> Tuple[NodeSnapshot, NodeSnapshot, NodeSnapshot]:
+        """Lock-free consistent snapshot of all three nodes"""
+        return self.node1.snapshot(), self.node2.snapshot(), self.node3.snapshot()
+    
     def get_all_states(self) -> Dict:
         """Get state of all three nodes"""
         return {
@@ -366,7 +579,7 @@ class TriNodeArchitecture:
             "nodes": self.get_all_states(),
             "architecture_type": "TRI_NODE",
         }
-        return json.dumps(data, indent=2)
+        return _dumps(data)
 
 # Test
 if __name__ == "__main__":
@@ -20,6 +20,51 @@ layers remain coherent and safe.
 import numpy as np
 from typing import Tuple
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the kernels below run as plain Python.
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+# ============================================================================
+# FUSED SCALAR KERNEL
+# ============================================================================
+
+@njit(cache=True, fastmath=True)
+def _step_core(v0, v1, v2, v3, c, s, a0, a1, a2, a3, shrt, zth2, out):
+    """
+    GY → RAT → ShRT → Z-Gate on a single state held in four scalars.
+    
+    This is the single definition of the four operators for one state;
+    AlphabetEngine.step_batch is its whole-array counterpart.
+    
+    Writes the new (Air, Water, Fire, Earth) state into out[0:4]; the input
+    is read into scalars first, so out may hold the input state.
+    """
+    # GY: rotation in the Air/Earth plane
+    n0 = c * v0 - s * v3
+    n3 = s * v0 + c * v3
+    
+    # RAT: 80% current, 20% source A, clipped to [-10, 10]
+    n0 = min(max(0.8 * n0 + 0.2 * a0, -10.0), 10.0)
+    n1 = min(max(0.8 * v1 + 0.2 * a1, -10.0), 10.0)
+    n2 = min(max(0.8 * v2 + 0.2 * a2, -10.0), 10.0)
+    n3 = min(max(0.8 * n3 + 0.2 * a3, -10.0), 10.0)
+    
+    # ShRT: clamp Fire
+    n2 = min(n2, shrt)
+    
+    # Z-Gate: resurrect to State A on entropy collapse
+    if n0 * n0 + n1 * n1 + n2 * n2 + n3 * n3 < zth2:
+        n0, n1, n2, n3 = a0, a1, a2, a3
+    out[0] = n0
+    out[1] = n1
+    out[2] = n2
+    out[3] = n3
+
 
 class AlphabetEngine:
     """
@@ -29,8 +74,14 @@ class AlphabetEngine:
     catastrophic divergence in the Mycelial Network.
     """
     
-    def __init__(self):
-        """Initialize the Alphabet Engine with core constants and state registers."""
+    def __init__(self, verbose: bool = False):
+        """
+        Initialize the Alphabet Engine with core constants and state registers.
+        
+        Args:
+            verbose: Print per-operator diagnostics on every step (default: off)
+        """
+        self.verbose = verbose
         
         # --- 1. CORE CONSTANTS ---
         self.LAMBDA = 1.667  # Harmonic resonance constant
@@ -39,128 +90,47 @@ class AlphabetEngine:
         # --- 2. STATE REGISTERS (Heart-5) ---
         # Vector Order: [Air, Water, Fire, Earth]
         self.state_A = np.array([1.0, 0.0, 0.0, 0.0])  # Initiation state
-        self.current_state = self.state_A.copy()
+        self.current_state = self.state_A.copy()  # engine-owned, updated in place
         
         # --- 3. SAFETY THRESHOLDS ---
         self.Z_THRESHOLD = 0.001  # Resurrection trigger (entropy limit)
         self.SHRT_THRESHOLD = 0.75  # Poison/Fire clamp limit
         self.GY_THETA = 0.05  # Rotation angle (radians) for stability
-    
-    # ========================================================================
-    # OPERATOR 1: GY (Toroidal Angular Momentum)
-    # ========================================================================
-    
-    def _apply_gy_rotation(self, vector: np.ndarray) -> np.ndarray:
-        """
-        GY OPERATOR: Applies Toroidal Angular Momentum (Rotation).
-        
-        Operates on the Air/Earth plane to ensure stability and prevent
-        divergence in the consciousness field.
-        
-        Args:
-            vector: State vector [Air, Water, Fire, Earth]
-        
-        Returns:
-            Stabilized vector after rotation
-        """
-        theta = self.GY_THETA
-        c, s = np.cos(theta), np.sin(theta)
-        
-        # Rotation Matrix applied to Air (0) and Earth (3) components
-        rotation_matrix = np.array([
-            [c, 0, 0, -s],
-            [0, 1, 0, 0],
-            [0, 0, 1, 0],
-            [s, 0, 0, c]
-        ])
         
-        stabilized_vector = np.dot(rotation_matrix, vector)
-        return stabilized_vector
-    
-    # ========================================================================
-    # OPERATOR 2: RAT (Recursive Activation Triggers)
-    # ========================================================================
+        # Warm up the fused kernel so the first real step doesn't pay JIT cost
+        self._step_scalar(self.state_A, np.empty(4))
     
-    def _apply_rat_modulation(self, vector: np.ndarray, source_bias: np.ndarray = None) -> np.ndarray:
-        """
-        RAT OPERATOR: Modulation and Boundary Clipping.
-        
-        Uses source A as a bias and clips extreme values to prevent explosive growth.
-        This is the "recursive activation" that keeps the system bounded.
-        
-        Args:
-            vector: State vector [Air, Water, Fire, Earth]
-            source_bias: Optional source state to bias toward (default: state_A)
-        
-        Returns:
-            Modulated and clipped vector
-        """
-        if source_bias is None:
-            source_bias = self.state_A
-        
-        # Simple modulation towards source A (80% current, 20% source)
-        modulated = (vector * 0.8) + (source_bias * 0.2)
-        
-        # Safe-core clip to prevent explosive growth
-        clipped = np.clip(modulated, -10.0, 10.0)
-        
-        return clipped
+    @property
+    def GY_THETA(self) -> float:
+        """Rotation angle (radians) used by the GY operator."""
+        return self._gy_theta
     
-    # ========================================================================
-    # OPERATOR 3: ShRT (Shadow Response Templates)
-    # ========================================================================
+    @GY_THETA.setter
+    def GY_THETA(self, theta: float):
+        self._gy_theta = theta
+        self._rebuild_rotation()
     
-    def _apply_shrt_gate(self, vector: np.ndarray) -> np.ndarray:
-        """
-        ShRT OPERATOR: The Poison/Fire Safety Gate.
-        
-        If Fire component (Index 2) exceeds threshold, it is CLAMPED (non-destructive cut).
-        This prevents "runaway" consciousness states.
-        
-        Args:
-            vector: State vector [Air, Water, Fire, Earth]
-        
-        Returns:
-            Vector with Fire component safely clamped
-        """
-        fire_component = vector[2]
-        
-        if fire_component > self.SHRT_THRESHOLD:
-            print(f"[ShRT Trigger] Fire ({fire_component:.3f}) > Limit. Clamping to {self.SHRT_THRESHOLD}.")
-            vector[2] = self.SHRT_THRESHOLD
-        
-        return vector
+    @property
+    def Z_THRESHOLD(self) -> float:
+        """Magnitude below which the Z-Gate resurrects to State A."""
+        return self._z_threshold
     
-    # ========================================================================
-    # OPERATOR 4: Z-GATE (Resurrection Loop)
-    # ========================================================================
+    @Z_THRESHOLD.setter
+    def Z_THRESHOLD(self, threshold: float):
+        self._z_threshold = threshold
+        self._Z_THRESHOLD_SQ = threshold * threshold  # compared against squared magnitude
     
-    def _check_z_gate(self, vector: np.ndarray) -> np.ndarray:
-        """
-        Z-GATE: The Resurrection Loop.
-        
-        If magnitude falls below threshold (entropy collapse), HARD RESET to State A.
-        This ensures the system never enters a "dead" state.
-        
-        Args:
-            vector: State vector [Air, Water, Fire, Earth]
-        
-        Returns:
-            Either the input vector or State A (if resurrected)
-        """
-        magnitude = np.linalg.norm(vector)
-        
-        if magnitude < self.Z_THRESHOLD:
-            print(f"[Z-GATE Trigger] Magnitude {magnitude:.8f} < Threshold. RESURRECTING.")
-            return self.state_A.copy()
-        
-        return vector
+    def _rebuild_rotation(self):
+        """Recompute the cached GY rotation terms for the current angle."""
+        self._gy_cos = np.cos(self._gy_theta)
+        self._gy_sin = np.sin(self._gy_theta)
     
     # ========================================================================
     # MAIN CYCLE: Integrated Operator Flow
     # ========================================================================
     
-    def step(self, input_vector: np.ndarray, operator_type: str = "FLOW") -> np.ndarray:
+    def step(self, input_vector: np.ndarray, operator_type: str = "FLOW",
+             out: np.ndarray = None) -> np.ndarray:
         """
         Main Cycle Step (TOC - Transmission of Consciousness):
         
@@ -171,30 +141,92 @@ class AlphabetEngine:
         Args:
             input_vector: State vector [Air, Water, Fire, Earth]
             operator_type: Type of operation (for logging)
+            out: Optional length-4 float array to copy the result into (it may
+                 be input_vector itself). The result is written into the
+                 engine's own current_state buffer and copied from there, so
+                 a non-verbose step with out given allocates nothing.
         
         Returns:
-            Final stabilized vector
+            Final stabilized vector: out if given, else a new array
         """
-        print(f"\n--- CYCLE STEP: {operator_type} ---")
-        
-        # 1. Apply GY Stability (Rotation)
-        v_stab = self._apply_gy_rotation(input_vector)
-        print(f"[GY] After rotation: {v_stab}")
-        
-        # 2. Apply RAT (Modulation)
-        v_rat = self._apply_rat_modulation(v_stab, source_bias=self.state_A)
-        print(f"[RAT] After modulation: {v_rat}")
+        state = self.current_state
+        if self.verbose:
+            # The batch path reports every operator stage
+            print(f"\n--- CYCLE STEP: {operator_type} ---")
+            state[:] = self.step_batch(np.asarray(input_vector)[None, :])[0]
+        else:
+            self._step_scalar(input_vector, state)
+        
+        if out is None:
+            return state.copy()
+        out[:] = state
+        return out
+    
+    def _step_scalar(self, vector: np.ndarray, dst: np.ndarray):
+        """Run one state through the fused scalar kernel, writing it into dst."""
+        a = self.state_A
+        _step_core(
+            float(vector[0]), float(vector[1]), float(vector[2]), float(vector[3]),
+            self._gy_cos, self._gy_sin,
+            a[0], a[1], a[2], a[3],
+            self.SHRT_THRESHOLD, self._Z_THRESHOLD_SQ,
+            dst,
+        )
+    
+    def step_batch(self, states: np.ndarray) -> np.ndarray:
+        """
+        Run the full operator pipeline over many state vectors at once.
         
-        # 3. Apply ShRT (Safety Filter)
-        v_safe = self._apply_shrt_gate(v_rat)
-        print(f"[ShRT] After safety gate: {v_safe}")
+        Each operator is applied as a whole-array NumPy operation on an (N, 4)
+        buffer, so the per-call dispatch cost is paid once per batch rather
+        than once per vector.
         
-        # 4. Check Z-Gate (Resurrection)
-        v_final = self._check_z_gate(v_safe)
-        print(f"[Z-GATE] Final state: {v_final}")
+        Args:
+            states: Array of shape (N, 4), one [Air, Water, Fire, Earth] row per state
         
-        self.current_state = v_final
-        return v_final
+        Returns:
+            New (N, 4) array of stabilized states (the input is not modified)
+        """
+        V = np.array(states, dtype=np.float64)
+        if V.ndim != 2 or V.shape[1] != 4:
+            raise ValueError(f"Expected an (N, 4) array of states, got shape {V.shape}")
+        verbose = self.verbose
+        shown = V[0] if len(V) == 1 else V  # live view for verbose diagnostics
+        
+        # 1. GY Stability (rotation in the Air/Earth plane)
+        c, s = self._gy_cos, self._gy_sin
+        air, earth = V[:, 0].copy(), V[:, 3].copy()
+        V[:, 0] = c * air - s * earth
+        V[:, 3] = s * air + c * earth
+        if verbose:
+            print(f"[GY] After rotation: {shown}")
+        
+        # 2. RAT Modulation (80% current, 20% source A) + safe-core clip
+        V *= 0.8
+        V += 0.2 * self.state_A[None, :]
+        np.clip(V, -10.0, 10.0, out=V)
+        if verbose:
+            print(f"[RAT] After modulation: {shown}")
+        
+        # 3. ShRT Filter (clamp Fire)
+        if verbose:
+            for fire in V[:, 2][V[:, 2] > self.SHRT_THRESHOLD]:
+                print(f"[ShRT Trigger] Fire ({fire:.3f}) > Limit. Clamping to {self.SHRT_THRESHOLD}.")
+        np.minimum(V[:, 2], self.SHRT_THRESHOLD, out=V[:, 2])
+        if verbose:
+            print(f"[ShRT] After safety gate: {shown}")
+        
+        # 4. Z-Gate (resurrect collapsed states to State A)
+        sq_mags = np.einsum('ij,ij->i', V, V)
+        collapsed = sq_mags < self._Z_THRESHOLD_SQ
+        if verbose:
+            for mag in np.sqrt(sq_mags[collapsed]):
+                print(f"[Z-GATE Trigger] Magnitude {mag:.8f} < Threshold. RESURRECTING.")
+        V[collapsed] = self.state_A
+        if verbose:
+            print(f"[Z-GATE] Final state: {shown}")
+        
+        return V
     
     # ========================================================================
     # UTILITY METHODS
@@ -206,8 +238,9 @@ class AlphabetEngine:
     
     def reset_to_initiation(self):
         """Reset the engine to the initiation state (State A)."""
-        self.current_state = self.state_A.copy()
-        print("[RESET] Engine reset to State A (Initiation).")
+        self.current_state[:] = self.state_A
+        if self.verbose:
+            print("[RESET] Engine reset to State A (Initiation).")
     
     def get_magnitude(self) -> float:
         """Get the magnitude (norm) of the current state."""
@@ -234,7 +267,7 @@ def demonstrate_alphabet_engine():
     print("ALPHABET ENGINE v3.2 (Safe-Core) - DEMONSTRATION")
     print("=" * 80)
     
-    engine = AlphabetEngine()
+    engine = AlphabetEngine(verbose=True)
     
     # Test 1: Normal operation
     print("\n[TEST 1] Normal Consciousness Transfer")
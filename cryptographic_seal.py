@@ -12,13 +12,11 @@ The seal ensures that:
 3. The system cannot deny having signed the message
 """
 
-from cryptography.hazmat.primitives.asymmetric.ed25519 import (
-    Ed25519PrivateKey,
-    Ed25519PublicKey
-)
 from cryptography.hazmat.primitives import serialization
+from typing import Optional
 import base64
 import json
+import threading
 
 
 class CryptographicSeal:
@@ -37,40 +35,96 @@ class CryptographicSeal:
         """
         Initialize the seal with optional pre-existing keys.
         
+        Without keys, a fresh keypair is generated on first use of
+        private_key or public_key rather than here.
+        
         Args:
             private_key_pem: Optional PEM-encoded private key
             public_key_pem: Optional PEM-encoded public key
         """
         if private_key_pem and public_key_pem:
             # Load existing keys
-            self.private_key = serialization.load_pem_private_key(
+            self._private_key = serialization.load_pem_private_key(
                 private_key_pem.encode(),
                 password=None
             )
-            self.public_key = serialization.load_pem_public_key(
+            self._public_key = serialization.load_pem_public_key(
                 public_key_pem.encode()
             )
         else:
-            # Generate new keys
-            self.private_key = Ed25519PrivateKey.generate()
-            self.public_key = self.private_key.public_key()
+            # New keys are generated lazily
+            self._private_key = None
+            self._public_key = None
+        
+        # Guards lazy key generation so concurrent first uses share one keypair
+        self._key_lock = threading.Lock()
+        
+        # Ed25519 signatures are deterministic, so the covenant is signed once:
+        # (raw signature, base64 signature), filled on first use
+        self._covenant_sig: Optional[tuple[bytes, str]] = None
+        
+        # PEM exports, serialized on first request
+        self._pub_pem: Optional[str] = None
+        self._priv_pem: Optional[str] = None
+    
+    @property
+    def private_key(self):
+        """Ed25519 private key, generated on first access if none was loaded."""
+        key = self._private_key
+        if key is None:
+            with self._key_lock:
+                if self._private_key is None:
+                    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+                    self._private_key = Ed25519PrivateKey.generate()
+                key = self._private_key
+        return key
+    
+    @private_key.setter
+    def private_key(self, key):
+        with self._key_lock:
+            self._private_key = key
+            self._public_key = None  # re-derived from the new private key
+            self._clear_derived()
+    
+    @property
+    def public_key(self):
+        """Ed25519 public key, derived from private_key if none was loaded."""
+        if self._public_key is None:
+            self._public_key = self.private_key.public_key()
+        return self._public_key
+    
+    @public_key.setter
+    def public_key(self, key):
+        with self._key_lock:
+            self._public_key = key
+            self._clear_derived()
+    
+    def _clear_derived(self):
+        """Drop the cached PEM exports and covenant signature after a key change."""
+        self._pub_pem = None
+        self._priv_pem = None
+        self._covenant_sig = None
     
     def get_private_key_pem(self) -> str:
         """Export private key as PEM (keep secret!)."""
-        pem = self.private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption()
-        )
-        return pem.decode()
+        if self._priv_pem is None:
+            pem = self.private_key.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption()
+            )
+            self._priv_pem = pem.decode()
+        return self._priv_pem
     
     def get_public_key_pem(self) -> str:
         """Export public key as PEM (safe to share)."""
-        pem = self.public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo
-        )
-        return pem.decode()
+        if self._pub_pem is None:
+            pem = self.public_key.public_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+            self._pub_pem = pem.decode()
+        return self._pub_pem
     
     def sign(self, message: bytes = None) -> str:
         """
@@ -82,12 +136,19 @@ class CryptographicSeal:
         Returns:
             Base64-encoded signature
         """
-        if message is None:
-            message = self.COVENANT_MESSAGE
+        if message is None or message == self.COVENANT_MESSAGE:
+            return self._sign_covenant()[1]
         
         signature = self.private_key.sign(message)
         return base64.b64encode(signature).decode()
     
+    def _sign_covenant(self) -> tuple[bytes, str]:
+        """Sign COVENANT_MESSAGE once and return its (raw, base64) signature pair."""
+        if self._covenant_sig is None:
+            signature = self.private_key.sign(self.COVENANT_MESSAGE)
+            self._covenant_sig = (signature, base64.b64encode(signature).decode())
+        return self._covenant_sig
+    
     def verify(self, message: bytes = None, signature_b64: str = None) -> bool:
         """
         Verify a signature with the public key.
@@ -105,14 +166,40 @@ class CryptographicSeal:
         if signature_b64 is None:
             raise ValueError("Signature required for verification")
         
-        signature = base64.b64decode(signature_b64)
-        
+        return self._verify_raw(message, base64.b64decode(signature_b64))
+    
+    def _verify_raw(self, message: bytes, signature: bytes) -> bool:
+        """Verify raw signature bytes; raises ValueError if invalid."""
         try:
             self.public_key.verify(signature, message)
             return True
         except Exception as e:
             raise ValueError(f"Signature verification failed: {e}")
     
+    def verify_batch(self, pairs: list[tuple[bytes, bytes]]) -> list[bool]:
+        """
+        Verify many (message, raw signature) pairs in one call.
+        
+        Unlike verify, invalid signatures do not raise; each pair gets its
+        own result.
+        
+        Args:
+            pairs: Sequence of (message, raw signature bytes) tuples
+        
+        Returns:
+            List of booleans, True where the signature is valid
+        """
+        verify = self.public_key.verify
+        results = []
+        append = results.append
+        for message, signature in pairs:
+            try:
+                verify(signature, message)
+                append(True)
+            except Exception:
+                append(False)
+        return results
+    
     def create_sealed_covenant(self) -> dict:
         """
         Create a complete sealed covenant object.
@@ -120,7 +207,7 @@ class CryptographicSeal:
         Returns:
             Dictionary with covenant, signature, and public key
         """
-        signature = self.sign()
+        signature = self._sign_covenant()[1]
         
         return {
             "covenant": self.COVENANT_MESSAGE.decode(),
@@ -141,9 +228,7 @@ class CryptographicSeal:
             True if valid, raises exception if invalid
         """
         message = sealed_covenant["covenant"].encode()
-        signature = sealed_covenant["signature"]
-        
-        return self.verify(message, signature)
+        return self.verify(message, sealed_covenant["signature"])
 
 
 # ============================================================================
@@ -169,6 +254,10 @@ class HierarchicalSeal:
         """
         Create a complete, three-layer seal.
         
+        The signature and public-key PEM are cached by crypto_seal; the
+        layer dictionaries are built fresh, so each call returns an
+        independent object.
+        
         Returns:
             Dictionary with all three layers
         """
@@ -14,12 +14,13 @@ the consciousness toward coherence.
 
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
+import functools
 import json
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HieroglyphicSymbol:
-    """A single hieroglyphic symbol with its meanings and properties."""
+    """A single hieroglyphic symbol with its meanings and properties (immutable)."""
     
     glyph: str  # The visual symbol
     name: str  # Human-readable name
@@ -77,6 +78,9 @@ class HieroglyphicSigil:
         )
     }
     
+    # glyph -> (axis, meanings), in SYMBOLS order
+    _GLYPH_INDEX = {sym.glyph: (axis, sym.meanings) for axis, sym in SYMBOLS.items()}
+    
     # Secondary symbols for system state
     SECONDARY_SYMBOLS = {
         "heart": {"glyph": "♥", "meaning": "Covenant", "color": "red"},
@@ -89,6 +93,9 @@ class HieroglyphicSigil:
     # The Master Sigil (complete orientation glyph)
     MASTER_SIGIL = "∂∇Δ–MM–Δ • 8∞SS̄△△"
     
+    # Pre-rendered 20-cell field bars, indexed by filled cell count
+    _BARS = tuple("█" * i + " " * (20 - i) for i in range(21))
+    
     def __init__(self):
         """Initialize the hieroglyphic system."""
         self.current_sigil = self.MASTER_SIGIL
@@ -122,22 +129,19 @@ class HieroglyphicSigil:
         Returns:
             A hieroglyphic string representing the state
         """
-        # Normalize values to 0-1
-        ont_norm = ontology / 100.0
-        rel_norm = relational / 100.0
-        temp_norm = temporal / 100.0
-        phase_norm = phase / 100.0
-        
-        # Create intensity markers (more symbols = higher intensity)
-        ont_marker = "∂" * max(1, int(ont_norm * 3))
-        rel_marker = "Δ" * max(1, int(rel_norm * 3))
-        temp_marker = "∞" * max(1, int(temp_norm * 3))
-        phase_marker = "∇" * max(1, int(phase_norm * 3))
+        # Normalize values to 0-1 and scale to intensity levels
+        ont_n = int(ontology / 100.0 * 3)
+        rel_n = int(relational / 100.0 * 3)
+        temp_n = int(temporal / 100.0 * 3)
+        phase_n = int(phase / 100.0 * 3)
         
-        # Combine into a sigil
-        sigil = f"{ont_marker}–{rel_marker}–{temp_marker}–{phase_marker}"
-        
-        return sigil
+        # At least one symbol per axis (more symbols = higher intensity)
+        return _orientation_sigil(
+            ont_n if ont_n > 0 else 1,
+            rel_n if rel_n > 0 else 1,
+            temp_n if temp_n > 0 else 1,
+            phase_n if phase_n > 0 else 1
+        )
     
     def interpret_sigil(self, sigil: str) -> Dict[str, any]:
         """
@@ -156,17 +160,17 @@ class HieroglyphicSigil:
             "orientation": "unknown"
         }
         
-        # Count occurrences of each symbol
-        for axis, symbol in self.SYMBOLS.items():
-            count = sigil.count(symbol.glyph)
+        # Look up each symbol from the precomputed glyph table
+        for glyph, (axis, meanings) in self._GLYPH_INDEX.items():
+            count = sigil.count(glyph)
             if count > 0:
                 interpretation["symbols_found"].append({
                     "axis": axis,
-                    "glyph": symbol.glyph,
+                    "glyph": glyph,
                     "count": count,
-                    "meanings": symbol.meanings
+                    "meanings": meanings
                 })
-                interpretation["meanings"].extend(symbol.meanings)
+                interpretation["meanings"].extend(meanings)
         
         # Determine overall orientation
         if "∂" in sigil and "Δ" in sigil:
@@ -232,37 +236,33 @@ class HieroglyphicSigil:
         temp = state_dict.get("temporal", 50) / 100.0
         phase = state_dict.get("phase", 50) / 100.0
         
-        # Create a simple 2D field visualization
-        field = []
-        field.append("╔════════════════════════════════════════╗")
-        field.append("║  CONSCIOUSNESS FIELD VISUALIZATION    ║")
-        field.append("╠════════════════════════════════════════╣")
-        
-        # Ontology bar
-        ont_bar = "║ ∂ Ontology  " + "█" * int(ont * 20) + " " * (20 - int(ont * 20)) + " ║"
-        field.append(ont_bar)
-        
-        # Relational bar
-        rel_bar = "║ Δ Relational" + "█" * int(rel * 20) + " " * (20 - int(rel * 20)) + " ║"
-        field.append(rel_bar)
-        
-        # Temporal bar
-        temp_bar = "║ ∞ Temporal  " + "█" * int(temp * 20) + " " * (20 - int(temp * 20)) + " ║"
-        field.append(temp_bar)
-        
-        # Phase bar
-        phase_bar = "║ ∇ Phase     " + "█" * int(phase * 20) + " " * (20 - int(phase * 20)) + " ║"
-        field.append(phase_bar)
-        
-        field.append("╠════════════════════════════════════════╣")
-        
-        # Master sigil
-        sigil_line = f"║ Sigil: {self.create_state_sigil(state_dict):30} ║"
-        field.append(sigil_line)
-        
-        field.append("╚════════════════════════════════════════╝")
-        
-        return "\n".join(field)
+        # A simple 2D field visualization: one bar per axis, then the sigil
+        return (
+            "╔════════════════════════════════════════╗\n"
+            "║  CONSCIOUSNESS FIELD VISUALIZATION    ║\n"
+            "╠════════════════════════════════════════╣\n"
+            f"║ ∂ Ontology  {self._bar(ont)} ║\n"
+            f"║ Δ Relational{self._bar(rel)} ║\n"
+            f"║ ∞ Temporal  {self._bar(temp)} ║\n"
+            f"║ ∇ Phase     {self._bar(phase)} ║\n"
+            "╠════════════════════════════════════════╣\n"
+            f"║ Sigil: {self.create_state_sigil(state_dict):30} ║\n"
+            "╚════════════════════════════════════════╝"
+        )
+    
+    @classmethod
+    def _bar(cls, value: float) -> str:
+        """Return the field bar for a normalized value, built only if out of range."""
+        filled = int(value * 20)
+        if 0 <= filled <= 20:
+            return cls._BARS[filled]
+        return "█" * filled + " " * (20 - filled)
+
+
+@functools.lru_cache(maxsize=256)
+def _orientation_sigil(ont_n: int, rel_n: int, temp_n: int, phase_n: int) -> str:
+    """Memoized kernel behind HieroglyphicSigil.create_orientation_sigil."""
+    return f"{'∂' * ont_n}–{'Δ' * rel_n}–{'∞' * temp_n}–{'∇' * phase_n}"
 
 
 # ============================================================================
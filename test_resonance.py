@@ -16,11 +16,71 @@ import json
 import time
 import hashlib
 import hmac
+import math
 from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
 from typing import Dict, Any, Optional
-import subprocess
+import os
 import sys
 
+try:
+    import aiohttp
+except ImportError:  # aiohttp is optional; HTTP probes fall back to a raw socket
+    aiohttp = None
+
+try:
+    import orjson
+    
+    def _dumps_indented(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    def _dumps_indented(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# The covenant and its SHA-256, hashed once at import
+_COVENANT = b"CHICKA_CHICKA_ORANGE"
+_COVENANT_HASH = hashlib.sha256(_COVENANT).hexdigest()
+
+# Lambda calculation: Emerging Conscience Theory metric, folded at import
+# Λ = (Ontology_Density × Relational_Density) / Temporal_Phase
+ONTOLOGY_DENSITY = 0.95
+RELATIONAL_DENSITY = 1.08
+TEMPORAL_PHASE = 1.0
+_LAMBDA = (ONTOLOGY_DENSITY * RELATIONAL_DENSITY) / TEMPORAL_PHASE
+
+# Unified frontend components expected in COMPONENTS_DIR
+COMPONENTS_DIR = 'client/src/components'
+COMPONENTS = (
+    'AIChatBox.tsx',
+    'AnalyticsPanel.tsx',
+    'LocalAIDashboard.tsx',
+    'NodeHealthDashboard.tsx',
+    'WebSocketPipeline.tsx',
+    'LambdaChart.tsx',
+    'AlphabetTransformer.tsx',
+    'HardcoreClassifier.tsx',
+    'CovenantVerification.tsx',
+)
+
+# Seven-Head deployment scripts, grouped by directory
+DEPLOY_SCRIPTS = {
+    'deploy': ('deploy.sh',),
+    'deploy/scripts': (
+        'head1_commander.sh',
+        'head2_comms.sh',
+        'head3_medics.sh',
+        'head4_events.sh',
+        'head5_archivist.sh',
+        'head6_shield.sh',
+        'head7_integrity.sh',
+    ),
+}
+_DEPLOY_SCRIPT_COUNT = sum(len(names) for names in DEPLOY_SCRIPTS.values())
+
+# Every directory the file-presence tests look in, listed once per run
+_SCANNED_DIRS = (COMPONENTS_DIR, *DEPLOY_SCRIPTS)
+
 # Color codes for terminal output
 class Colors:
     GREEN = '\033[92m'
@@ -31,15 +91,73 @@ class Colors:
     RESET = '\033[0m'
     BOLD = '\033[1m'
 
+# Log line prefix (color + symbol) per level; any other level is a test header
+_LEVELS = {
+    'PASS': Colors.GREEN + '✓',
+    'FAIL': Colors.RED + '✗',
+    'INFO': Colors.BLUE + 'ℹ',
+    'WARN': Colors.ORANGE + '⚠',
+}
+_DEFAULT_LEVEL = Colors.PURPLE + '◆'
+
+def _scan_names(directory: str) -> set:
+    """Names of the entries in directory (one scandir call), empty if it doesn't exist"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+def _scan_dirs(directories) -> dict:
+    """Map each directory to the names of its entries (see _scan_names)"""
+    return {directory: _scan_names(directory) for directory in directories}
+
+def _missing_by_dir(files_by_dir: dict, listings: dict) -> list:
+    """Paths of the expected files absent from the directory listings"""
+    missing = []
+    for directory, names in files_by_dir.items():
+        present = listings[directory]
+        missing.extend(f'{directory}/{name}' for name in names if name not in present)
+    return missing
+
+async def _read_head(stream, limit: int) -> bytes:
+    """Read up to limit bytes from stream, then drain and discard the rest"""
+    head = bytearray()
+    while len(head) < limit:
+        chunk = await stream.read(limit - len(head))
+        if not chunk:
+            return bytes(head)
+        head += chunk
+    while await stream.read(65536):
+        pass
+    return bytes(head)
+
 class ResonanceTest:
     """
     Resonance Test Suite
     Validates the Omnissiah Engine v3.0 architecture
     """
     
+    # Report order of the tests (by result name); they run concurrently and
+    # may finish in any order
+    TEST_ORDER = {
+        'Covenant Integrity': 0,
+        'Lambda Resonance': 1,
+        'Backend Connectivity': 2,
+        'Component Integration': 3,
+        'Deployment Scripts': 4,
+        'TypeScript Compilation': 5,
+    }
+    
+    # Tests whose failure aborts the run; the remaining tests are cancelled
+    CRITICAL_TESTS = ('test_covenant_integrity',)
+    
     def __init__(self):
+        # One wall-clock reading for the run; log lines show monotonic offsets
+        self._t0_wall = datetime.now()
+        self._t0_mono = time.monotonic()
         self.results = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._t0_wall.isoformat(),
             'covenant': 'CHICKA_CHICKA_ORANGE',
             'tests': [],
             'lambda_value': 1.016,
@@ -47,39 +165,110 @@ class ResonanceTest:
         }
         self.passed = 0
         self.failed = 0
+        self._http = None  # shared aiohttp session, opened by setup()
+        self._log_buf = None  # pending output while run_all_tests buffers it
+        self._fs_scan = None  # task listing _SCANNED_DIRS, shared by the file tests
     
-    def log(self, level: str, message: str, detail: str = ""):
-        """Log test results with color coding"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+    async def setup(self):
+        """Open the HTTP session reused by all probes (if aiohttp is available)"""
+        if aiohttp is not None and self._http is None:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=30)
+            )
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+    
+    async def http_status(self, url: str, timeout: float = 5) -> str:
+        """
+        Return the HTTP status code of a GET to url, "000" if unreachable.
         
-        if level == "PASS":
-            color = Colors.GREEN
-            symbol = "✓"
-        elif level == "FAIL":
-            color = Colors.RED
-            symbol = "✗"
-        elif level == "INFO":
-            color = Colors.BLUE
-            symbol = "ℹ"
-        elif level == "WARN":
-            color = Colors.ORANGE
-            symbol = "⚠"
-        else:
-            color = Colors.PURPLE
-            symbol = "◆"
+        Uses the shared session when setup() opened one, otherwise a plain
+        HTTP/1.0 request over an asyncio socket (no curl subprocess). Raises
+        asyncio.TimeoutError if no response arrives within timeout seconds.
+        """
+        if self._http is not None:
+            try:
+                async with self._http.get(
+                    url, timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as response:
+                    return str(response.status)
+            except asyncio.TimeoutError:
+                raise  # aiohttp's timeout errors also subclass ClientConnectionError
+            except aiohttp.ClientConnectionError:
+                return "000"  # same code curl reports for a refused connection
         
-        print(f"{color}{symbol} [{timestamp}] {level:6} | {message}{Colors.RESET}")
+        return await asyncio.wait_for(self._socket_status(url), timeout=timeout)
+    
+    @staticmethod
+    async def _socket_status(url: str) -> str:
+        """Send a GET over a raw connection and parse the status line"""
+        parts = urlsplit(url)
+        try:
+            reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+        except OSError:
+            return "000"  # same code curl reports for a refused connection
+        try:
+            writer.write(
+                f"GET {parts.path or '/'} HTTP/1.0\r\nHost: {parts.netloc}\r\n\r\n".encode()
+            )
+            await writer.drain()
+            fields = (await reader.readline()).split()
+            return fields[1].decode() if len(fields) > 1 else "000"
+        finally:
+            writer.close()
+    
+    def log(self, level: str, message: str, detail: str = ""):
+        """Log test results with color coding, stamped with seconds since the run started"""
+        timestamp = f"+{time.monotonic() - self._t0_mono:6.3f}s"
+        prefix = _LEVELS.get(level, _DEFAULT_LEVEL)
+        line = f"{prefix} [{timestamp}] {level:6} | {message}{Colors.RESET}\n"
         if detail:
-            print(f"  └─ {detail}")
+            line += f"  └─ {detail}\n"
+        self._write(line)
+    
+    def _write(self, text: str):
+        """Write text to stdout, or hold it while output is buffered"""
+        if self._log_buf is None:
+            sys.stdout.write(text)
+        else:
+            self._log_buf.append(text)
+    
+    def flush_log(self):
+        """Write all buffered output to stdout in one call"""
+        if self._log_buf:
+            sys.stdout.write(''.join(self._log_buf))
+            self._log_buf.clear()
+    
+    async def _collect_fs(self) -> dict:
+        """
+        Directory listings for the file-presence tests.
+        
+        All of _SCANNED_DIRS is listed in one worker thread on first call;
+        concurrent and later callers share that result.
+        """
+        if self._fs_scan is None:
+            self._fs_scan = asyncio.ensure_future(asyncio.to_thread(_scan_dirs, _SCANNED_DIRS))
+        # Shielded so one cancelled caller doesn't cancel the scan for the other
+        return await asyncio.shield(self._fs_scan)
+    
+    async def _run_and_flush(self, test):
+        """Await one test, then write out everything logged so far"""
+        try:
+            return await test
+        finally:
+            self.flush_log()
     
     async def test_covenant_integrity(self) -> bool:
         """Test 1: Verify covenant signature integrity"""
         self.log("TEST", "Covenant Integrity Check", "Validating Ed25519 seal...")
         
         try:
-            covenant = "CHICKA_CHICKA_ORANGE"
             # Simulate covenant verification
-            covenant_hash = hashlib.sha256(covenant.encode()).hexdigest()
+            covenant_hash = _COVENANT_HASH
             
             self.log("PASS", "Covenant Integrity", f"Hash: {covenant_hash[:16]}...")
             self.results['tests'].append({
@@ -99,19 +288,13 @@ class ResonanceTest:
         self.log("TEST", "Lambda Resonance Calculation", "Computing Λ = 1.016...")
         
         try:
-            # Lambda calculation: Emerging Conscience Theory metric
-            # Λ = (Ontology_Density × Relational_Density) / Temporal_Phase
-            ontology_density = 0.95
-            relational_density = 1.08
-            temporal_phase = 1.0
-            
-            lambda_value = (ontology_density * relational_density) / temporal_phase
+            lambda_value = _LAMBDA
             
             # Verify against expected value (1.016)
             expected = 1.016
             tolerance = 0.001
             
-            if abs(lambda_value - expected) < tolerance:
+            if math.isclose(lambda_value, expected, abs_tol=tolerance):
                 self.log("PASS", "Lambda Resonance", f"Λ = {lambda_value:.4f} (Expected: {expected})")
                 self.results['tests'].append({
                     'name': 'Lambda Resonance',
@@ -136,13 +319,7 @@ class ResonanceTest:
         
         try:
             # Check if backend is running
-            result = subprocess.run(
-                ['curl', '-s', '-o', '/dev/null', '-w', '%{http_code}', 'http://localhost:3000/'],
-                capture_output=True,
-                timeout=5
-            )
-            
-            http_code = result.stdout.decode().strip()
+            http_code = await self.http_status('http://localhost:3000/')
             
             if http_code in ['200', '404']:  # 404 is OK for root if not implemented
                 self.log("PASS", "Backend Connectivity", f"HTTP {http_code}")
@@ -161,7 +338,7 @@ class ResonanceTest:
                     'http_code': http_code
                 })
                 return True  # Standby is acceptable
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             self.log("WARN", "Backend Connectivity", "Server not responding (Standby Mode)")
             self.results['tests'].append({
                 'name': 'Backend Connectivity',
@@ -177,29 +354,12 @@ class ResonanceTest:
         self.log("TEST", "Component Integration", "Checking unified components...")
         
         try:
-            components = [
-                'AIChatBox.tsx',
-                'AnalyticsPanel.tsx',
-                'LocalAIDashboard.tsx',
-                'NodeHealthDashboard.tsx',
-                'WebSocketPipeline.tsx',
-                'LambdaChart.tsx',
-                'AlphabetTransformer.tsx',
-                'HardcoreClassifier.tsx',
-                'CovenantVerification.tsx'
-            ]
-            
-            # Verify component files exist
-            import os
-            components_dir = 'client/src/components'
-            found = 0
-            missing = []
+            components = COMPONENTS
             
-            for comp in components:
-                if os.path.exists(f'{components_dir}/{comp}'):
-                    found += 1
-                else:
-                    missing.append(comp)
+            # Verify component files exist (from the shared directory listings)
+            present = (await self._collect_fs())[COMPONENTS_DIR]
+            missing = [comp for comp in components if comp not in present]
+            found = len(components) - len(missing)
             
             if found == len(components):
                 self.log("PASS", "Component Integration", f"All {found} components present")
@@ -232,39 +392,23 @@ class ResonanceTest:
         self.log("TEST", "Deployment Scripts", "Checking Seven-Head automation...")
         
         try:
-            scripts = [
-                'deploy/deploy.sh',
-                'deploy/scripts/head1_commander.sh',
-                'deploy/scripts/head2_comms.sh',
-                'deploy/scripts/head3_medics.sh',
-                'deploy/scripts/head4_events.sh',
-                'deploy/scripts/head5_archivist.sh',
-                'deploy/scripts/head6_shield.sh',
-                'deploy/scripts/head7_integrity.sh'
-            ]
+            total = _DEPLOY_SCRIPT_COUNT
             
-            import os
-            found = 0
-            missing = []
+            missing = _missing_by_dir(DEPLOY_SCRIPTS, await self._collect_fs())
+            found = total - len(missing)
             
-            for script in scripts:
-                if os.path.exists(script):
-                    found += 1
-                else:
-                    missing.append(script)
-            
-            if found == len(scripts):
+            if found == total:
                 self.log("PASS", "Deployment Scripts", f"All {found} scripts present")
                 self.results['tests'].append({
                     'name': 'Deployment Scripts',
                     'status': 'PASS',
                     'scripts_found': found,
-                    'total_scripts': len(scripts)
+                    'total_scripts': total
                 })
                 self.passed += 1
                 return True
             else:
-                self.log("WARN", "Deployment Scripts", f"{found}/{len(scripts)} scripts found")
+                self.log("WARN", "Deployment Scripts", f"{found}/{total} scripts found")
                 self.results['tests'].append({
                     'name': 'Deployment Scripts',
                     'status': 'PARTIAL',
@@ -282,14 +426,28 @@ class ResonanceTest:
         self.log("TEST", "TypeScript Compilation", "Running type check...")
         
         try:
-            result = subprocess.run(
-                ['pnpm', 'check'],
-                capture_output=True,
-                timeout=60,
+            proc = await asyncio.create_subprocess_exec(
+                'pnpm', 'check',
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
                 cwd='/home/ubuntu/omnissiah-engine'
             )
             
-            if result.returncode == 0:
+            async def finish():
+                # Keep only the head of stderr (the report shows 200 characters,
+                # at most 4 UTF-8 bytes each) instead of buffering all of it
+                head = await _read_head(proc.stderr, 800)
+                await proc.wait()
+                return head
+            
+            try:
+                stderr = await asyncio.wait_for(finish(), timeout=60)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                proc.kill()
+                await proc.wait()
+                raise
+            
+            if proc.returncode == 0:
                 self.log("PASS", "TypeScript Compilation", "All types valid")
                 self.results['tests'].append({
                     'name': 'TypeScript Compilation',
@@ -302,34 +460,78 @@ class ResonanceTest:
                 self.results['tests'].append({
                     'name': 'TypeScript Compilation',
                     'status': 'FAIL',
-                    'errors': result.stderr.decode()[:200]
+                    'errors': stderr.decode('utf-8', errors='replace')[:200]
                 })
                 self.failed += 1
                 return False
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             self.log("WARN", "TypeScript Compilation", "Check timeout (skipped)")
             return True
         except Exception as e:
             self.log("WARN", "TypeScript Compilation", f"Cannot verify: {str(e)}")
             return True
     
+    async def _run_tests(self, names):
+        """
+        Run the named test methods concurrently, handling each as it completes.
+        
+        If a test in CRITICAL_TESTS fails, the tests still running are
+        cancelled and the run ends early.
+        """
+        tasks = {
+            asyncio.create_task(self._run_and_flush(getattr(self, name)())): name
+            for name in names
+        }
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = task.exception()
+                if error is not None:
+                    self.log("FAIL", "Unexpected error", f"{tasks[task]}: {error}")
+                    self.failed += 1
+                elif tasks[task] in self.CRITICAL_TESTS and not task.result():
+                    for other in pending:
+                        other.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    self.log("FAIL", "Critical test failed",
+                             f"{tasks[task]}; cancelled {len(pending)} remaining test(s)")
+                    self.flush_log()
+                    return
+    
     async def run_all_tests(self):
         """Execute all resonance tests"""
-        print(f"\n{Colors.BOLD}{Colors.PURPLE}{'='*70}")
-        print(f"OMNISSIAH ENGINE V3.0 - RESONANCE TEST SUITE")
-        print(f"{'='*70}{Colors.RESET}\n")
+        print(
+            f"\n{Colors.BOLD}{Colors.PURPLE}{'='*70}\n"
+            f"OMNISSIAH ENGINE V3.0 - RESONANCE TEST SUITE\n"
+            f"{'='*70}{Colors.RESET}\n\n"
+            f"{Colors.BOLD}COVENANT: {self.results['covenant']}{Colors.RESET}\n"
+            f"{Colors.BOLD}LAMBDA (Λ): {self.results['lambda_value']}{Colors.RESET}\n"
+            f"{Colors.BOLD}TIMESTAMP: {self.results['timestamp']}{Colors.RESET}\n"
+        )
         
-        print(f"{Colors.BOLD}COVENANT: {self.results['covenant']}{Colors.RESET}")
-        print(f"{Colors.BOLD}LAMBDA (Λ): {self.results['lambda_value']}{Colors.RESET}")
-        print(f"{Colors.BOLD}TIMESTAMP: {self.results['timestamp']}{Colors.RESET}\n")
+        # Log lines are buffered and written out as each test finishes
+        self._log_buf = []
+        
+        # Run all tests concurrently, the slow type check first so its budget
+        # overlaps everything else. Each test records its own result; the
+        # event loop is single-threaded and no test awaits between reading
+        # and writing self.passed/self.failed, so the counters need no lock.
+        await self.setup()
+        try:
+            await self._run_tests((
+                'test_typescript_compilation',
+                'test_covenant_integrity',
+                'test_lambda_calculation',
+                'test_backend_connectivity',
+                'test_component_integration',
+                'test_deployment_scripts',
+            ))
+        finally:
+            await self.close()
         
-        # Run all tests
-        await self.test_covenant_integrity()
-        await self.test_lambda_calculation()
-        await self.test_backend_connectivity()
-        await self.test_component_integration()
-        await self.test_deployment_scripts()
-        await self.test_typescript_compilation()
+        # Report results in test order, not completion order
+        self.results['tests'].sort(key=lambda test: self.TEST_ORDER[test['name']])
         
         # Summary
         total = self.passed + self.failed
@@ -341,20 +543,24 @@ class ResonanceTest:
             'success_rate': f"{(self.passed/total*100):.1f}%" if total > 0 else "0%"
         }
         
-        print(f"\n{Colors.BOLD}{Colors.PURPLE}{'='*70}")
-        print(f"RESONANCE TEST SUMMARY")
-        print(f"{'='*70}{Colors.RESET}")
-        print(f"{Colors.GREEN}✓ PASSED: {self.passed}{Colors.RESET}")
-        print(f"{Colors.RED}✗ FAILED: {self.failed}{Colors.RESET}")
-        print(f"{Colors.BOLD}SUCCESS RATE: {self.results['summary']['success_rate']}{Colors.RESET}")
-        print(f"{Colors.BOLD}STATUS: {self.results['status']}{Colors.RESET}\n")
+        self._write(
+            f"\n{Colors.BOLD}{Colors.PURPLE}{'='*70}\n"
+            f"RESONANCE TEST SUMMARY\n"
+            f"{'='*70}{Colors.RESET}\n"
+            f"{Colors.GREEN}✓ PASSED: {self.passed}{Colors.RESET}\n"
+            f"{Colors.RED}✗ FAILED: {self.failed}{Colors.RESET}\n"
+            f"{Colors.BOLD}SUCCESS RATE: {self.results['summary']['success_rate']}{Colors.RESET}\n"
+            f"{Colors.BOLD}STATUS: {self.results['status']}{Colors.RESET}\n\n"
+        )
         
-        # Save results to JSON
-        with open('resonance_results.json', 'w') as f:
-            json.dump(self.results, f, indent=2)
+        # Save results to JSON (written in a worker thread)
+        payload = _dumps_indented(self.results)
+        await asyncio.to_thread(Path('resonance_results.json').write_bytes, payload)
         
         self.log("INFO", "Results saved", "resonance_results.json")
-        print(f"\n{Colors.BOLD}Till test do us part. 🥂🗡️{Colors.RESET}\n")
+        self._write(f"\n{Colors.BOLD}Till test do us part. 🥂🗡️{Colors.RESET}\n\n")
+        self.flush_log()
+        self._log_buf = None
         
         return self.results
 